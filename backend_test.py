@@ -17,6 +17,7 @@ class FHEAPBackendTester:
         self.tests_run = 0
         self.tests_passed = 0
         self.test_results = []
+        self.session = requests.Session()
 
     def log_test(self, name: str, success: bool, details: str = "", response_data: Any = None):
         """Log test results"""
@@ -49,9 +50,9 @@ class FHEAPBackendTester:
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=10)
+                response = self.session.get(url, headers=headers, timeout=10)
             elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=10)
+                response = self.session.post(url, json=data, headers=headers, timeout=10)
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
@@ -120,7 +121,7 @@ class FHEAPBackendTester:
         
         try:
             # Test if we can reach the base URL
-            response = requests.get(self.base_url, timeout=10)
+            response = self.session.get(self.base_url, timeout=10)
             success = response.status_code in [200, 404, 405]  # Any response is good
             self.log_test("Base URL Connectivity", success, 
                          f"Status: {response.status_code}")
@@ -131,7 +132,7 @@ class FHEAPBackendTester:
                 'Access-Control-Request-Method': 'GET',
                 'Access-Control-Request-Headers': 'Content-Type'
             }
-            response = requests.options(f"{self.api_base}/health", headers=headers, timeout=10)
+            response = self.session.options(f"{self.api_base}/health", headers=headers, timeout=10)
             cors_success = response.status_code in [200, 204]
             self.log_test("CORS Preflight", cors_success, 
                          f"Status: {response.status_code}")